@@ -31,13 +31,10 @@ def creation_tads_dataframe(filename: str, resolution: int, window: int, boundar
         df = df[['chrom', 'start', 'end']]
 
     out_list = []
-    for index, row in df.iterrows():
-        if row['chrom'] == df.iloc[index+1][0]:
-          start = (row['start'] + row['end']) / 2
-          end = (df.iloc[index+1][1] + df.iloc[index+1][2]) / 2
-          out_list.append([row['chrom'], int(start), int(end)])
-        if index+1 == df.shape[0]-1:
-            break
+    rows = list(df.itertuples(index=False, name=None))
+    for (chrom, start, end), (next_chrom, next_start, next_end) in zip(rows, rows[1:]):
+        if chrom == next_chrom:
+            out_list.append([chrom, int((start + end) / 2), int((next_start + next_end) / 2)])
 
     result_dataframe = pd.DataFrame(out_list, columns=['chrom', 'start', 'end'])
 
@@ -1,5 +1,4 @@
 import sys
-import time
 import traceback
 import typing
 
@@ -31,10 +30,8 @@ def wrapper_print(func: typing.Callable) -> typing.Callable:
             result = func(*args, **kwargs)
             sys.stderr.write(f'Completed successfully!                       \r')
             sys.stderr.flush()
-            time.sleep(2)
             sys.stdout.write(f'{FUNC_NAMES[func.__name__][1]}{result}\n')
             sys.stdout.flush()
-            time.sleep(2)
         except Exception as e:
             sys.stderr.write(traceback.format_exc())
     return wrapper
@@ -1,10 +1,13 @@
 import os
 import typing
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
+import bioframe
 import cooler
 import numpy as np
 import pandas as pd
+from numba import njit
 from scipy.stats import mannwhitneyu
 
 from src.func_condition_wrapper import wrapper_print
@@ -21,8 +24,12 @@ def create_tads_tables(path_tad_1: os.path, path_tad_2: os.path) -> tuple[pd.Dat
     :param path_tad_2: Path to the second TADs CSV file.
     :return tuple[pd.DataFrame, pd.DataFrame]: DataFrames containing TADs information
     """
-    tad1 = pd.read_csv(path_tad_1, index_col=0)
-    tad2 = pd.read_csv(path_tad_2, index_col=0)
+    tad1 = pd.read_csv(path_tad_1, index_col=0, engine='pyarrow')
+    tad2 = pd.read_csv(path_tad_2, index_col=0, engine='pyarrow')
+    chrom_dtype = pd.CategoricalDtype(pd.unique(np.concatenate([tad1['chrom'].to_numpy(),
+                                                                tad2['chrom'].to_numpy()])))
+    tad1['chrom'] = tad1['chrom'].astype(chrom_dtype)
+    tad2['chrom'] = tad2['chrom'].astype(chrom_dtype)
     return tad1, tad2
 
 
@@ -59,35 +66,26 @@ def get_chroms_coords(tad1: pd.DataFrame, tad2: pd.DataFrame, chrom: str) -> tup
 def modify_tads_map_by_condition(tad1_chr_coords: pd.DataFrame,
                                  binsize: int, length_flexibility: float) -> pd.DataFrame:
     """
-    Increases the size of the TAD of the first card according to the condition for further search
+    Increases the size of the TAD of the first card according to the condition for further search.
+    The unmodified coordinates are kept in the start_orig and end_orig columns
+    so they can be written out again without a demodification round-trip.
 
     :param tad1_chr_coords: DataFrame containing TAD coordinates for a chromosome.
     :param binsize: Bin size.
     :param length_flexibility: Length flexibility coefficient.
     :return pd.DataFrame: Modified TADs map.
     """
-    tad1_search_regs = pd.DataFrame()
-    tad1_search_regs['chrom'] = tad1_chr_coords['chrom']
-    tad1_search_regs['start'] = tad1_chr_coords['start'] - BINSIZE_COEF * binsize
-    tad1_search_regs['end'] = tad1_chr_coords['end'] + BINSIZE_COEF * binsize
-    tad1_search_regs['size'] = (tad1_chr_coords['end'] - tad1_chr_coords['start']) * length_flexibility
+    starts = tad1_chr_coords['start'].to_numpy()
+    ends = tad1_chr_coords['end'].to_numpy()
+    tad1_search_regs = pd.DataFrame({'chrom': tad1_chr_coords['chrom'].array,
+                                     'start': starts - BINSIZE_COEF * binsize,
+                                     'end': ends + BINSIZE_COEF * binsize,
+                                     'size': (ends - starts) * length_flexibility,
+                                     'start_orig': starts,
+                                     'end_orig': ends})
     return tad1_search_regs
 
 
-def find_min_and_max_tad_coords(tad1_2_regions: pd.DataFrame) -> pd.DataFrame:
-    """
-    Find the minimum and maximum TAD coordinates.
-
-    :param tad1_2_regions: DataFrame containing TAD coordinates.
-    :return: DataFrame containing minimum and maximum TAD coordinates.
-    """
-    tad2_regions = pd.DataFrame
-    tad2_regions['start_tad2'] = tad1_2_regions.start_tad2.min()
-    tad2_regions['end_tad2'] = tad1_2_regions.end_tad2.max()
-    tad2_regions['size_tad2'] = tad1_2_regions.size_tad2.sum()
-    return tad2_regions
-
-
 def add_size_column(tad2_chr_coords: pd.DataFrame) -> pd.DataFrame:
     """
     Add a size column to the DataFrame based on start and end coordinates.
@@ -95,24 +93,15 @@ def add_size_column(tad2_chr_coords: pd.DataFrame) -> pd.DataFrame:
     :param tad2_chr_coords: DataFrame containing chromosome coordinates.
     :return: DataFrame with added size column.
     """
-    tad2_comp_regs = tad2_chr_coords
-    tad2_comp_regs = tad2_comp_regs.assign(size=tad2_comp_regs['end'] - tad2_comp_regs['start'])
+    starts = tad2_chr_coords['start'].to_numpy()
+    ends = tad2_chr_coords['end'].to_numpy()
+    tad2_comp_regs = pd.DataFrame({'chrom': tad2_chr_coords['chrom'].array,
+                                   'start': starts,
+                                   'end': ends,
+                                   'size': ends - starts})
     return tad2_comp_regs
 
 
-def demodify_tads_map(tads_region_intersect: pd.DataFrame, binsize: int) -> pd.DataFrame:
-    """
-    Demodify the TADs map by adjusting start and end coordinates.
-    :param tads_region_intersect: DataFrame containing TADs region intersections.
-    :param binsize: Bin size.
-    :return pd.DataFrame: Demodified DataFrame with adjusted coordinates.
-    """
-    tads_region_intersect['start_tad1'] = tads_region_intersect['start_tad1'] + BINSIZE_COEF * binsize
-    tads_region_intersect['end_tad1'] = tads_region_intersect['end_tad1'] - BINSIZE_COEF * binsize
-    tads_region_intersect['size_tad1'] = tads_region_intersect['end_tad1'] - tads_region_intersect['start_tad1']
-    return tads_region_intersect
-
-
 def find_split(tad1_chr_coords: pd.DataFrame, tad2_chr_coords: pd.DataFrame,
                binsize: int = 100_000, length_flexibility: float = 1.1) -> pd.DataFrame:
     """
@@ -126,23 +115,38 @@ def find_split(tad1_chr_coords: pd.DataFrame, tad2_chr_coords: pd.DataFrame,
     """
     tad1_search_regs = modify_tads_map_by_condition(tad1_chr_coords, binsize, length_flexibility)
     tad2_comp_regs = add_size_column(tad2_chr_coords)
-    tads_region_intersect = pd.merge(tad1_search_regs, tad2_comp_regs, on='chrom', how='outer',
-                                     suffixes=('_tad1', '_tad2'))
-    tads_region_intersect = tads_region_intersect.loc[
-        (tads_region_intersect.start_tad1 <= tads_region_intersect.start_tad2) &
-        (tads_region_intersect.end_tad1 >= tads_region_intersect.end_tad2) &
-        (tads_region_intersect.size_tad1 >= tads_region_intersect.size_tad2)]
-
-    tads_region_intersect = tads_region_intersect[tads_region_intersect.duplicated(subset='start_tad1', keep=False)]
-    tads_region_intersect_size = tads_region_intersect.groupby(['chrom', 'start_tad1', 'end_tad1', 'size_tad1']).agg(
-        {'start_tad2': 'min', 'end_tad2': 'max', 'size_tad2': 'sum'})
-    tads_region_intersect_size = tads_region_intersect_size.reset_index()
-    tads_region_intersect_size = tads_region_intersect_size.query('size_tad1 >= size_tad2')
-    tads_region_intersect = tads_region_intersect[
-        tads_region_intersect['start_tad1'].isin(tads_region_intersect_size['start_tad1'])]
+    tads_region_intersect = bioframe.overlap(tad1_search_regs, tad2_comp_regs, how='inner',
+                                             suffixes=('_tad1', '_tad2'))
+    tads_region_intersect = tads_region_intersect.rename(columns={'chrom_tad1': 'chrom'})
+    tads_region_intersect = tads_region_intersect.drop(columns='chrom_tad2')
+    contained = ((tads_region_intersect['start_tad1'].to_numpy() <= tads_region_intersect['start_tad2'].to_numpy()) &
+                 (tads_region_intersect['end_tad1'].to_numpy() >= tads_region_intersect['end_tad2'].to_numpy()) &
+                 (tads_region_intersect['size_tad1'].to_numpy() >= tads_region_intersect['size_tad2'].to_numpy()))
+    tads_region_intersect = tads_region_intersect[contained]
+
+    starts1 = tads_region_intersect['start_tad1'].to_numpy()
+    sizes1 = tads_region_intersect['size_tad1'].to_numpy()
+    sizes2 = tads_region_intersect['size_tad2'].to_numpy()
+    keys, inverse, counts = np.unique(starts1, return_inverse=True, return_counts=True)
+    size2_sums = np.bincount(inverse, weights=sizes2, minlength=keys.size)
+    size1_per_key = np.empty(keys.size)
+    size1_per_key[inverse] = sizes1
+    keep = (counts > 1) & (size1_per_key >= size2_sums)
+    tads_region_intersect = tads_region_intersect[keep[inverse]]
     return tads_region_intersect
 
 
+def _find_split_for_chrom(chrom_coords: tuple) -> pd.DataFrame:
+    """
+    Run find_split on one chromosome's coordinate pair; helper for the process pool.
+
+    :param chrom_coords: Tuple of TAD coordinate DataFrames for one chromosome.
+    :return pd.DataFrame: DataFrame containing split regions.
+    """
+    tad1_chr_coords, tad2_chr_coords = chrom_coords
+    return find_split(tad1_chr_coords, tad2_chr_coords)
+
+
 def find_region(main_tad_coords: list, small_tads_coords: list) -> tuple:
     """
     Find the region that encompasses the main TAD and all the small TADs.
@@ -162,136 +166,184 @@ def find_region(main_tad_coords: list, small_tads_coords: list) -> tuple:
     return region
 
 
-def find_coords(position: float, coords: list) -> int:
+def find_coords(positions: np.ndarray, starts: np.ndarray) -> np.ndarray:
     """
-    Find the index of the coordinate pair containing the given position.
+    Find the indices of the bins containing the given positions.
 
-    :param position: Position to find.
-    :param coords: List of coordinate pairs.
-    :return int: Index of the coordinate pair containing the given position.
+    :param positions: Positions to find.
+    :param starts: Sorted array of bin start coordinates.
+    :return np.ndarray: Indices of the bins containing the given positions.
     """
-    for i, (first, second) in enumerate(coords):
-        if first <= position <= second:
-            return i
+    return np.searchsorted(starts, positions, side='right') - 1
 
 
-def calculate_pvalue(square_intensity: np.ndarray, hill_intensity: np.ndarray) -> float:
+def stack_padded(arrays: list) -> np.ndarray:
     """
-    Calculate the p-value using Mann-Whitney U test.
+    Right-pad 1-D arrays with NaN to a common length and stack them into 2-D.
 
-    :param square_intensity: Intensity values for the square region.
-    :param hill_intensity: Intensity values for the hill region.
-    :return float: Calculated p-value.
+    :param arrays: List of 1-D arrays of varying lengths.
+    :return np.ndarray: 2-D array with one padded input array per row.
     """
-    stat, pvalue = mannwhitneyu(square_intensity, hill_intensity, method='asymptotic')
-    return pvalue
+    width = max(array.size for array in arrays)
+    stacked = np.full((len(arrays), width), np.nan)
+    for row, array in enumerate(arrays):
+        stacked[row, :array.size] = array
+    return stacked
 
 
-def calculate_intensity(diff_matrix: pd.DataFrame, small_tads_coords: list, coords: list) -> float:
+def calculate_pvalue(square_intensity: np.ndarray, hill_intensity: np.ndarray) -> np.ndarray:
     """
-    Calculate the intensity and p-value between square and hill regions.
+    Calculate the p-values using Mann-Whitney U test.
+
+    Both inputs are 2-D with one NaN-padded sample per row, so all tests
+    run in a single vectorized scipy call.
+
+    :param square_intensity: Intensity values for the square regions, one row per TAD group.
+    :param hill_intensity: Intensity values for the hill regions, one row per TAD group.
+    :return np.ndarray: Calculated p-values, one per row.
+    """
+    result = mannwhitneyu(square_intensity, hill_intensity, method='asymptotic',
+                          nan_policy='omit', axis=-1)
+    return np.atleast_1d(result.pvalue)
+
+
+@njit(cache=True, error_model='numpy')
+def _accumulate_intensity(diff_matrix: np.ndarray, starts_1: np.ndarray, ends_1: np.ndarray,
+                          starts_2: np.ndarray, ends_2: np.ndarray,
+                          square_intensity: np.ndarray, hill_intensity: np.ndarray) -> None:
+    """
+    Fill the square and hill arrays with per-column block means of diff_matrix.
+
+    :param diff_matrix: Difference matrix between two contact matrices.
+    :param starts_1: Matrix indices of the first small TAD of each pair.
+    :param ends_1: Matrix indices of the first small TAD of each pair.
+    :param starts_2: Matrix indices of the second small TAD of each pair.
+    :param ends_2: Matrix indices of the second small TAD of each pair.
+    :param square_intensity: Preallocated output array for the square means.
+    :param hill_intensity: Preallocated output array for the hill means.
+    """
+    square_pos = 0
+    hill_pos = 0
+    for pair in range(starts_1.size):
+        start_1, end_1 = starts_1[pair], ends_1[pair]
+        start_2, end_2 = starts_2[pair], ends_2[pair]
+        for col in range(start_2 + 1, end_2 + 1):
+            acc = 0.0
+            for row in range(start_1, end_1):
+                acc += diff_matrix[row, col]
+            square_intensity[square_pos] = acc / (end_1 - start_1)
+            square_pos += 1
+        for col in range(start_1, end_1 + 1):
+            acc = 0.0
+            for row in range(start_1, end_1 + 1):
+                acc += diff_matrix[row, col]
+            hill_intensity[hill_pos] = acc / (end_1 + 1 - start_1)
+            hill_pos += 1
+    start_2, end_2 = starts_2[-1], ends_2[-1]
+    for col in range(start_2, end_2 + 1):
+        acc = 0.0
+        for row in range(start_2, end_2 + 1):
+            acc += diff_matrix[row, col]
+        hill_intensity[hill_pos] = acc / (end_2 + 1 - start_2)
+        hill_pos += 1
+
+
+def calculate_intensity(diff_matrix: np.ndarray, small_tads_coords: list,
+                        starts: np.ndarray, offset: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the intensity of the square and hill regions.
 
     :param diff_matrix: Difference matrix between two contact matrices.
     :param small_tads_coords: Coordinates of the small TADs.
-    :param coords: List of bin coordinates.
-    :return float: Calculated p-value.
-    """
-    square_intensity = []
-    hill_intensity = []
-    for tad_id, small_tad in enumerate(small_tads_coords):
-        if tad_id == (len(small_tads_coords) - 1):
-            hill_intensity.extend(
-                diff_matrix.iloc[start_2_corrected:end_2_corrected + 1,
-                                 start_2_corrected:end_2_corrected + 1].mean().to_numpy())
-            continue
-        start1, end1 = small_tad[0], small_tad[1]
-        start2, end2 = small_tads_coords[tad_id + 1][0], small_tads_coords[tad_id + 1][1]
-        start_1_corrected, end_1_corrected = find_coords(start1, coords), find_coords(end1, coords)
-        start_2_corrected, end_2_corrected = find_coords(start2, coords), find_coords(end2, coords)
-
-        square_intensity.extend(
-            diff_matrix.iloc[start_1_corrected:end_1_corrected,
-                             start_2_corrected + 1:end_2_corrected + 1].mean().to_numpy())
-        hill_intensity.extend(
-            diff_matrix.iloc[start_1_corrected:end_1_corrected + 1,
-                             start_1_corrected:end_1_corrected + 1].mean().to_numpy())
-
-    return calculate_pvalue(square_intensity, hill_intensity)
+    :param starts: Sorted array of chromosome-wide bin start coordinates.
+    :param offset: Index of the first bin of the fetched region in starts.
+    :return tuple[np.ndarray, np.ndarray]: Square and hill intensity values.
+    """
+    corrected = find_coords(np.asarray(small_tads_coords), starts) - offset
+    starts_1, ends_1 = corrected[:-1, 0], corrected[:-1, 1]
+    starts_2, ends_2 = corrected[1:, 0], corrected[1:, 1]
+    square_intensity = np.empty(int((ends_2 - starts_2).sum()))
+    hill_intensity = np.empty(int((ends_1 - starts_1 + 1).sum() + ends_2[-1] - starts_2[-1] + 1))
+    _accumulate_intensity(diff_matrix, starts_1, ends_1, starts_2, ends_2,
+                          square_intensity, hill_intensity)
+    return square_intensity, hill_intensity
 
 
 def create_diff_matrix(main_tad_coords: list, small_tads_coords: list,
-                       clr_1: cooler.Cooler, clr_2: cooler.Cooler) -> float:
+                       sel_1: cooler.core.RangeSelector2D, sel_2: cooler.core.RangeSelector2D,
+                       chrom_starts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
     Create the difference matrix and calculate intensity.
 
     :param main_tad_coords: Coordinates of the main TAD [chrom, start, end].
     :param small_tads_coords: Coordinates of the small TADs [[start1, end1], [start2, end2], ...].
-    :param clr_1: Cooler object for the first contact matrix.
-    :param clr_2: Cooler object for the second contact matrix.
-    :return float: Calculated intensity.
+    :param sel_1: Matrix selector for the first contact matrix.
+    :param sel_2: Matrix selector for the second contact matrix.
+    :param chrom_starts: Sorted array of bin start coordinates for the whole chromosome.
+    :return tuple[np.ndarray, np.ndarray]: Square and hill intensity values.
     """
     region = find_region(main_tad_coords, small_tads_coords)
-    matrix1 = clr_1.matrix(balance=False).fetch(region)
-    matrix2 = clr_2.matrix(balance=False).fetch(region)
-    bins = clr_1.bins().fetch(region)
-    coords = list(bins[['start', 'end']].itertuples(index=False, name=None))
-    diff_matrix = np.log(matrix1 + 1) - np.log(matrix2 + 1)
-    diff_matrix_df = pd.DataFrame(diff_matrix, columns=coords, index=coords)
-    return calculate_intensity(diff_matrix_df, small_tads_coords, coords)
+    matrix1 = sel_1.fetch(region)
+    matrix2 = sel_2.fetch(region)
+    offset = int(find_coords(region[1], chrom_starts))
+    diff_matrix = np.log1p(matrix1.astype(np.float32, copy=False))
+    diff_matrix -= np.log1p(matrix2.astype(np.float32, copy=False))
+    return calculate_intensity(diff_matrix, small_tads_coords, chrom_starts, offset)
 
 
-def choose_region(df: pd.DataFrame, clr_1: cooler.Cooler,
-                  clr_2: cooler.Cooler) -> pd.DataFrame:
+def choose_region(df: pd.DataFrame, sel_1: cooler.core.RangeSelector2D,
+                  sel_2: cooler.core.RangeSelector2D,
+                  bins_sel: cooler.core.RangeSelector1D) -> pd.DataFrame:
     """
     Choose the regions to analyze and calculate p-values.
 
     :param df: DataFrame containing TAD coordinates.
-    :param clr_1: Cooler object for the first contact matrix.
-    :param clr_2: Cooler object for the second contact matrix.
+    :param sel_1: Matrix selector for the first contact matrix.
+    :param sel_2: Matrix selector for the second contact matrix.
+    :param bins_sel: Bin selector for the first contact matrix.
     :return pd.DataFrame: DataFrame with added p-values.
     """
-    small_tads_coords = []
     df_with_value = df
-    df_with_value['pvalue'] = np.nan
-    big_tad_indicies = []
-    for index, row in df.iterrows():
-        if index == 0:
-            main_tad_coords = row[['chrom', 'start_tad1', 'end_tad1']].to_list()
-
-        if main_tad_coords != row[['chrom', 'start_tad1', 'end_tad1']].to_list():
-            pvalue = create_diff_matrix(main_tad_coords, small_tads_coords,
-                                        clr_1, clr_2)
-            first = big_tad_indicies[0]
-            last = big_tad_indicies[-1]
-            df_with_value.loc[first:last, 'pvalue'] = pvalue
-            main_tad_coords = row[['chrom', 'start_tad1', 'end_tad1']].to_list()
-            small_tads_coords = []
-            big_tad_indicies = []
-
-        big_tad_indicies.append(index)
-        small_tads_coords.append(row[['start_tad2', 'end_tad2']].to_list())
-
-        if index == df.index[-1]:
-            pvalue = create_diff_matrix(main_tad_coords, small_tads_coords,
-                                        clr_1, clr_2)
-            first = big_tad_indicies[0]
-            last = big_tad_indicies[-1]
-            df_with_value.loc[first:last, 'pvalue'] = pvalue
+    group_indices = []
+    square_intensities = []
+    hill_intensities = []
+    chrom_starts_cache = {}
+    groups = df.groupby(['chrom', 'start_tad1', 'end_tad1'], sort=False, observed=True)
+    for main_tad_coords, group in groups:
+        chrom = main_tad_coords[0]
+        if chrom not in chrom_starts_cache:
+            chrom_starts_cache[chrom] = bins_sel.fetch(chrom)['start'].to_numpy()
+        small_tads_coords = list(zip(group['start_tad2'].to_numpy(),
+                                     group['end_tad2'].to_numpy()))
+        square_intensity, hill_intensity = create_diff_matrix([*main_tad_coords], small_tads_coords,
+                                                              sel_1, sel_2, chrom_starts_cache[chrom])
+        group_indices.append(group.index.to_numpy())
+        square_intensities.append(square_intensity)
+        hill_intensities.append(hill_intensity)
+    if not group_indices:
+        df_with_value['pvalue'] = np.nan
+        return df_with_value
+    group_pvalues = calculate_pvalue(stack_padded(square_intensities), stack_padded(hill_intensities))
+    pvalue_column = np.empty(len(df))
+    for indices, pvalue in zip(group_indices, group_pvalues):
+        pvalue_column[indices] = pvalue
+    df_with_value['pvalue'] = pvalue_column
     return df_with_value
 
 
 def save_frame(path_save: os.path, option: str,
-               saving_dataframe: pd.DataFrame, binsize: int) -> typing.NoReturn:
+               saving_dataframe: pd.DataFrame) -> typing.NoReturn:
     """
     Save the DataFrame to a CSV file with proper naming conventions.
 
     :param path_save: Path to save the DataFrame.
     :param option: Option indicating split or merge.
     :param saving_dataframe: DataFrame to save.
-    :param binsize: Bin size.
     :return typing.NoReturn: No return
     """
-    saving_dataframe = demodify_tads_map(saving_dataframe, binsize)
+    saving_dataframe['start_tad1'] = saving_dataframe['start_orig_tad1']
+    saving_dataframe['end_tad1'] = saving_dataframe['end_orig_tad1']
+    saving_dataframe = saving_dataframe.drop(columns=['start_orig_tad1', 'end_orig_tad1'])
     if option == "merge":
         saving_dataframe = saving_dataframe.rename(columns={"start_tad1": "start_2", "start_tad2": "start_1",
                                                             "end_tad1": "end_2", "end_tad2": "end_1"})
@@ -325,22 +377,24 @@ def main_split_merge_detection(clr1_filename: os.path, clr2_filename: os.path,
     """
     clr_1 = cooler.Cooler(f'{clr1_filename}::resolutions/{resolution}')
     clr_2 = cooler.Cooler(f'{clr2_filename}::resolutions/{resolution}')
+    sel_1 = clr_1.matrix(balance=False)
+    sel_2 = clr_2.matrix(balance=False)
+    bins_sel = clr_1.bins()
     split_merge_episodes = []
     for option in ['split', 'merge']:
-        tad_split_table = pd.DataFrame()
         tad1, tad2 = create_tads_tables(path_tad_1, path_tad_2)
         if option == 'merge':
             tad1, tad2 = tad2, tad1
 
         tad_chrom_list = get_chrom_list(tad1, tad2)
-        for chrom in tad_chrom_list:
-            tad1_chr_coords, tad2_chr_coords = get_chroms_coords(tad1, tad2, chrom)
-            if tad_split_table.empty is True:
-                tad_split_table = find_split(tad1_chr_coords, tad2_chr_coords)
-            else:
-                tad_split_table = pd.concat([tad_split_table, find_split(tad1_chr_coords, tad2_chr_coords)],
-                                            ignore_index=True)
-        final_table = choose_region(tad_split_table, clr_1, clr_2)
-        save_frame(path_save, option, final_table, binsize)
+        chrom_coords = [get_chroms_coords(tad1, tad2, chrom) for chrom in tad_chrom_list]
+        if len(chrom_coords) > 1:
+            with ProcessPoolExecutor(max_workers=min(len(chrom_coords), os.cpu_count())) as executor:
+                split_parts = list(executor.map(_find_split_for_chrom, chrom_coords))
+        else:
+            split_parts = [_find_split_for_chrom(coords) for coords in chrom_coords]
+        tad_split_table = pd.concat(split_parts, ignore_index=True)
+        final_table = choose_region(tad_split_table, sel_1, sel_2, bins_sel)
+        save_frame(path_save, option, final_table)
         split_merge_episodes.append(final_table[['start_tad1', 'end_tad1']].drop_duplicates().shape[0])
     return tuple(split_merge_episodes)